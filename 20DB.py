@@ -1,10 +1,14 @@
+import os
 import pickle
 from typing import Dict, Any, Tuple, List
 
-from dash import Dash, html, dash_table, dcc, callback, Output, Input
+from dash import Dash, html, dash_table, dcc, Output, Input, State
+import numpy as np
 import pandas as pd
-import plotly.express as px
-from pandas.api.types import is_timedelta64_dtype
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.colors import qualitative
+from pandas.api.types import is_string_dtype
 
 # =========================
 # Config
@@ -12,6 +16,8 @@ from pandas.api.types import is_timedelta64_dtype
 PICKLE_PATH = "ea26Top20.pkl"
 DEFAULT_MINERAL = "Magnesium"
 TOP_K = 5
+# Sanitized top-k cache, one file per k (e.g. ea26Top20_top5.pkl)
+TOP_PATH = f"{os.path.splitext(PICKLE_PATH)[0]}_top{TOP_K}.pkl"
 VALUE_COL = "monthly concentration"
 AVG_COL = "average monthly concentration"
 
@@ -25,40 +31,116 @@ UK_GEO = dict(
     showland=True,
 )
 
+# Same defaults Plotly Express uses for color/symbol per Sampling Point
+POINT_COLORS = pio.templates[pio.templates.default].layout.colorway or qualitative.Plotly
+POINT_SYMBOLS = ["circle", "diamond", "square", "x", "cross"]
+GEO_SIZE_MAX = 20
+
+# Dot-chart series longer than 4 points per pixel column are M4-decimated
+DOT_WIDTH_PX = 1200
+
+# Component styles, shared by every table/graph instead of rebuilt per component
+TABLE_HEADER_STYLE = {"margin": 8, "fontSize": 12, "fontWeight": "bold"}
+TABLE_CELL_STYLE = {
+    "fontSize": 12,
+    "textAlign": "left",
+    "whiteSpace": "normal",
+    "height": "auto",
+}
+GRAPH_STYLE = {"padding": 10, "width": "70%"}
+
+# orjson is much faster than stdlib json for the figure payloads Dash sends back
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = "orjson"
+except ImportError:  # pragma: no cover
+    pass
+
 
 # =========================
 # Data loading & preprocessing
 # =========================
-def get_top(base: Dict[str, Dict[str, pd.DataFrame]], k: int) -> Dict[str, Dict[str, pd.DataFrame]]:
+def get_top(
+    base: Dict[str, Dict[str, pd.DataFrame]], k: int
+) -> Tuple[Dict[str, Dict[str, pd.DataFrame]], Dict[str, Dict[str, pd.DataFrame]]]:
     """
     For each mineral (key), each sub-df (e.g., 'Total', etc.), keep rows
     belonging to the top-k (Sampling Point, Type) groups by mean concentration.
+    Also returns a per-group summary (one row per top-k group, sorted by mean,
+    descending) so the tables don't have to dedupe the row-level frames.
     """
     basic_cols = ["Sampling Point", "lat", "long", "Type", "YearMonth"]
     gb = ["Sampling Point", "lat", "long", "Type"]
     out: Dict[str, Dict[str, pd.DataFrame]] = {}
+    summary_out: Dict[str, Dict[str, pd.DataFrame]] = {}
 
     for mineral, sub in base.items():
         sub_out: Dict[str, pd.DataFrame] = {}
+        sub_summary: Dict[str, pd.DataFrame] = {}
         for name, df in sub.items():
-            # Compute per-(Sampling Point, Type) mean once
-            means = (
-                df.groupby(gb, as_index=False)[VALUE_COL]
-                  .mean()
-                  .rename(columns={VALUE_COL: AVG_COL})
+            # Compact group id per row (-1 for rows with a missing key); with
+            # sort=False ids follow first appearance
+            grouped = df.groupby(gb, sort=False, observed=True)
+            codes = grouped.ngroup().to_numpy(dtype=np.int64, na_value=-1)
+
+            # Per-group mean, indexed by group id (same group order as ngroup). Kept
+            # as pandas' mean so near-equal means compare exactly as nlargest saw them
+            vals = grouped[VALUE_COL].mean().to_numpy(dtype=np.float64)
+
+            # Top-k groups by mean, as group ids (one sort over the groups, not the rows).
+            # Same picks as nlargest(keep="first"): the stable sort breaks ties by
+            # lowest id, and NaN means sort last, so they only fill the remaining
+            # slots when fewer than k groups have a real one
+            top_ids = np.argsort(-vals, kind="stable")[:k]
+
+            # Keep rows from those groups (mask instead of a join) + attach the mean
+            # by group id (positional lookup, no key index to build)
+            mask = np.isin(codes, top_ids)
+            keep = df.loc[mask, basic_cols + [VALUE_COL]]
+            keep = keep.assign(**{AVG_COL: vals[codes[mask]]})
+            sub_out[name] = keep
+            # Summary keys come from each top group's first row. Ties keep
+            # first-appearance order (ids ascending + stable sort)
+            ids, first_rows = np.unique(codes, return_index=True)
+            top_ids = np.sort(top_ids)
+            sub_summary[name] = (
+                df.iloc[first_rows[ids >= 0][top_ids]][gb]
+                  .assign(**{AVG_COL: vals[top_ids]})
+                  .sort_values(by=[AVG_COL], ascending=False, kind="stable")
             )
-            # Top-k groups by mean
-            top_keys = means.nlargest(k, AVG_COL)[gb]
+        out[mineral] = sub_out
+        summary_out[mineral] = sub_summary
+    return out, summary_out
 
-            # Keep rows from those groups + attach the mean
-            keep = df.merge(top_keys.assign(_keep=1), on=gb, how="inner")
-            keep = keep.merge(means, on=gb, how="left", suffixes=(None, "_y"))
 
-            # Select standard columns
-            keep = keep[basic_cols + [VALUE_COL, AVG_COL]].copy()
-            sub_out[name] = keep
-        out[mineral] = sub_out
-    return out
+def flatten_base(base: Dict[str, Dict[str, pd.DataFrame]]) -> pd.DataFrame:
+    """
+    Long-form view of a nested base: one frame with categorical 'mineral' and
+    'test' (sub-df name) columns, for passes that cover every sub-df at once.
+    """
+    long = pd.concat(
+        [df.assign(mineral=mineral, test=name) for mineral, sub in base.items() for name, df in sub.items()],
+        ignore_index=True,
+    )
+    cat_cols = ["mineral", "test", "Sampling Point", "Type"]
+    return long.astype({col: "category" for col in cat_cols if col in long.columns})
+
+
+def value_ranges(base: Dict[str, Dict[str, pd.DataFrame]]) -> Dict[Tuple[str, str], Tuple[float, float]]:
+    """
+    (mineral, sub-df name) -> (min, max) concentration, ignoring NaN. One
+    grouped pass over the long-form base, for the dot-chart y-axis ranges.
+    """
+    # Every sub-df gets an entry; empty ones have no rows in the long frame
+    ranges: Dict[Tuple[str, str], Tuple[float, float]] = {
+        (mineral, name): (np.nan, np.nan) for mineral, sub in base.items() for name in sub
+    }
+    if not ranges:
+        return ranges
+    long = flatten_base(base)
+    stats = long.groupby(["mineral", "test"], sort=False, observed=True)[VALUE_COL].agg(["min", "max"])
+    ranges.update((key, (float(lo), float(hi))) for key, lo, hi in zip(stats.index, stats["min"], stats["max"]))
+    return ranges
 
 
 def get_minerals(dfs: Dict[str, Any]) -> List[str]:
@@ -68,39 +150,19 @@ def get_minerals(dfs: Dict[str, Any]) -> List[str]:
 # =========================
 # Dtype helpers (no is_period_dtype)
 # =========================
-# Use isinstance on dtype/array types; fall back to string check.
+# Dispatch on the dtype object only (one pass over df.dtypes, no per-Series checks).
 try:
     from pandas import PeriodDtype
 except Exception:  # pragma: no cover
     PeriodDtype = type("PeriodDtypeMissing", (), {})  # fallback
 
-try:
-    from pandas.arrays import PeriodArray
-except Exception:  # pragma: no cover
-    PeriodArray = type("PeriodArrayMissing", (), {})
-
 try:
     from pandas import DatetimeTZDtype
 except Exception:  # pragma: no cover
     DatetimeTZDtype = type("DatetimeTZDtypeMissing", (), {})
 
-
-def _series_is_period(s: pd.Series) -> bool:
-    dt = getattr(s, "dtype", None)
-    return (
-        isinstance(dt, PeriodDtype)
-        or isinstance(getattr(s, "array", None), PeriodArray)
-        or str(dt).startswith("period[")
-    )
-
-
-def _series_is_tzaware_datetime(s: pd.Series) -> bool:
-    return isinstance(getattr(s, "dtype", None), DatetimeTZDtype)
-
-
-def _series_is_timedelta(s: pd.Series) -> bool:
-    dt = getattr(s, "dtype", None)
-    return is_timedelta64_dtype(s) or getattr(dt, "kind", "") == "m"
+# Plain numeric columns never need converting
+_NUMERIC_KINDS = ("b", "i", "u", "f")
 
 
 def sanitize_base(base: Dict[str, Dict[str, pd.DataFrame]]) -> None:
@@ -110,6 +172,7 @@ def sanitize_base(base: Dict[str, Dict[str, pd.DataFrame]]) -> None:
       - Period series -> Timestamp (if time-like name) else str
       - tz-aware datetimes -> naive UTC
       - timedelta -> seconds (float)
+      - Sampling Point / Type strings -> category
     """
     for _, sub in base.items():
         for _, df in sub.items():
@@ -118,152 +181,260 @@ def sanitize_base(base: Dict[str, Dict[str, pd.DataFrame]]) -> None:
                 df.index = df.index.to_timestamp()
 
             # Columns
-            for col in list(df.columns):
-                s = df[col]
+            for col, dt in df.dtypes.items():
+                kind = getattr(dt, "kind", "")
+                if kind in _NUMERIC_KINDS:
+                    continue
                 try:
-                    if _series_is_period(s):
+                    if isinstance(dt, PeriodDtype):
                         if col.lower() in ("yearmonth", "time", "month", "period", "date"):
-                            df[col] = s.dt.to_timestamp()
+                            df[col] = df[col].dt.to_timestamp()
                         else:
-                            df[col] = s.astype(str)
-                    elif _series_is_tzaware_datetime(s):
-                        df[col] = s.dt.tz_convert("UTC").dt.tz_localize(None)
-                    elif _series_is_timedelta(s):
-                        df[col] = (s.astype("int64") / 1e9)  # seconds
+                            df[col] = df[col].astype(str)
+                    elif isinstance(dt, DatetimeTZDtype):
+                        df[col] = df[col].dt.tz_convert("UTC").dt.tz_localize(None)
+                    elif kind == "m":
+                        df[col] = df[col].dt.total_seconds()
                 except Exception:
                     # Safety: never fail at import/startup
                     pass
 
+            # Repeated labels -> category codes (cheaper groupby/dedup/sort)
+            for col in ("Sampling Point", "Type"):
+                if col in df.columns and is_string_dtype(df[col].dtype):
+                    df[col] = df[col].astype("category")
+
+
+def load_base(
+    path: str, cache_path: str, k: int
+) -> Tuple[Dict[str, Dict[str, pd.DataFrame]], Dict[str, Dict[str, pd.DataFrame]]]:
+    """
+    Load the raw pickle, sanitize it and keep the top-k groups (get_top's rows
+    and summary). The result is stored in cache_path and reused on later
+    starts while the raw file, k and this module are unchanged.
+    """
+    stamp = (os.path.getmtime(path), os.path.getmtime(__file__), k)
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+        if cached["stamp"] == stamp:
+            return cached["base"], cached["summary"]
+    except Exception:
+        # Missing, stale or unreadable cache -> rebuild below
+        pass
+
+    with open(path, "rb") as f:
+        base = pickle.load(f)
+    sanitize_base(base)
+    base, summary = get_top(base, k)
+
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump({"stamp": stamp, "base": base, "summary": summary}, f, protocol=5)
+    except OSError:
+        # Read-only deploy: run without the cache
+        pass
+    return base, summary
+
 
 # =========================
 # Figure / table builders
 # =========================
+def _by_point(df: pd.DataFrame, cols: List[str]) -> List[Tuple[str, Dict[str, np.ndarray]]]:
+    """
+    Split df into per-Sampling Point column arrays, in order of first
+    appearance (the trace/color order Plotly Express would use).
+    """
+    grouped = df.groupby("Sampling Point", sort=False, observed=True)
+    return [(str(sp), {c: g[c].to_numpy() for c in cols}) for sp, g in grouped]
+
+
+def m4_decimate(d: Dict[str, np.ndarray], x: str, y: str, width: int) -> Dict[str, np.ndarray]:
+    """
+    M4 decimation of one series: keep the first, last, min and max point of each
+    of `width` equal-width x buckets, which draws the same as the full series at
+    that pixel width. Series with <= 4 * width points are returned as-is.
+    """
+    n = len(d[x])
+    if n <= 4 * width:
+        return d
+
+    xv = d[x].astype("int64")
+    order = np.argsort(xv, kind="stable")
+    xs = xv[order]
+    ys = d[y][order].astype(np.float64)
+    # Offset / span in float: the integer product (xs - xs[0]) * width overflows
+    # int64 for datetime64[ns] spans of a few years. Clip guards rounding up to width.
+    bucket = ((xs - xs[0]) / (xs[-1] - xs[0] + 1) * width).astype(np.int64)
+    bucket = np.minimum(bucket, width - 1)
+
+    # Buckets are contiguous runs of the x-sorted series
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], n] - 1
+    # Sorting by (bucket, y) keeps each bucket's run in place: its first element is
+    # the bucket's min; same with -y for the max. NaN never wins either.
+    by_min = np.lexsort((np.where(np.isnan(ys), np.inf, ys), bucket))
+    by_max = np.lexsort((np.where(np.isnan(ys), np.inf, -ys), bucket))
+
+    keep = np.unique(np.concatenate([starts, ends, by_min[starts], by_max[starts]]))
+    idx = np.sort(order[keep])
+    return {col: arr[idx] for col, arr in d.items()}
+
+
 def build_geo_fig(point_agg: Dict[str, Dict[str, pd.DataFrame]], mineral: str, k: int):
-    df = point_agg[mineral]["Total"].copy()
-
-    # Drop potential troublemaker used by other charts
-    df = df.drop(columns=["YearMonth"], errors="ignore")
-
-    # Keep only the columns used by the chart to minimize JSON
-    cols = ["Sampling Point", "lat", "long", "Type", AVG_COL]
-    df = df[cols]
-
-    fig = px.scatter_geo(
-        df,
-        lat="lat",
-        lon="long",
-        color="Sampling Point",
-        hover_name="Sampling Point",
-        size=AVG_COL,
-        opacity=0.5,
-        hover_data={"Type": True, AVG_COL: ":.2f"},
+    # Traces are built straight from numpy arrays (no Plotly Express frame parsing)
+    df = point_agg[mineral]["Total"]
+    sizeref = df[AVG_COL].max() / GEO_SIZE_MAX**2
+
+    traces = []
+    for i, (sp, d) in enumerate(_by_point(df, ["lat", "long", "Type", AVG_COL])):
+        traces.append(
+            go.Scattergeo(
+                name=sp,
+                legendgroup=sp,
+                showlegend=True,
+                mode="markers",
+                # float32 coordinates are plenty for the map and halve those arrays;
+                # cast only here so get_top still groups on the full-precision keys
+                lat=d["lat"].astype(np.float32),
+                lon=d["long"].astype(np.float32),
+                hovertext=np.full(len(d["lat"]), sp, dtype=object),
+                customdata=np.column_stack([d["Type"], d[AVG_COL]]),
+                hovertemplate=(
+                    f"<b>%{{hovertext}}</b><br><br>Sampling Point={sp}"
+                    f"<br>{AVG_COL}=%{{customdata[1]:.2f}}<br>lat=%{{lat}}<br>long=%{{lon}}"
+                    "<br>Type=%{customdata[0]}<extra></extra>"
+                ),
+                marker=dict(
+                    color=POINT_COLORS[i % len(POINT_COLORS)],
+                    opacity=0.5,
+                    # Only relative size matters: float32 halves the array
+                    size=d[AVG_COL].astype(np.float32),
+                    sizemode="area",
+                    sizeref=sizeref,
+                    symbol="circle",
+                ),
+            )
+        )
+
+    fig = go.Figure(traces)
+    fig.update_layout(
+        geo=UK_GEO,
+        legend=dict(title_text="Sampling Point", tracegroupgap=0, itemsizing="constant"),
+        margin=dict(t=60),
+        title=f"UK — {mineral} Distribution (Top {k} Sites)",
     )
-    fig.update_layout(geo=UK_GEO, title=f"UK — {mineral} Distribution (Top {k} Sites)")
     return fig
 
 
-def build_dot_fig(month_agg: Dict[str, Dict[str, pd.DataFrame]], mineral: str):
+def build_dot_fig(
+    month_agg: Dict[str, Dict[str, pd.DataFrame]],
+    mineral: str,
+    ranges: Dict[Tuple[str, str], Tuple[float, float]],
+):
+    """
+    Expects sanitized frames (YearMonth as timestamps) and y ranges from
+    value_ranges. Display names only go into labels; the frames are not renamed.
+    """
     figures = []
-    for name, d in month_agg[mineral].items():
-        df = d.copy()
-        df.rename(columns={VALUE_COL: "Detected Concentration", "YearMonth": "Time"}, inplace=True)
-
-        if "Time" in df.columns:
-            dtype_str = str(getattr(df["Time"], "dtype", ""))
-            if isinstance(getattr(df["Time"], "dtype", None), PeriodDtype) or dtype_str.startswith("period["):
-                df["Time"] = df["Time"].dt.to_timestamp()
-
-        ymin = df["Detected Concentration"].min()
-        ymax = df["Detected Concentration"].max()
-
-        fig = px.scatter(
-            df,
-            x="Time",
-            y="Detected Concentration",
-            color="Sampling Point",
-            symbol="Sampling Point",
+    for name, df in month_agg[mineral].items():
+        ymin, ymax = ranges[(mineral, name)]
+        series = [
+            (sp, m4_decimate(d, "YearMonth", VALUE_COL, DOT_WIDTH_PX))
+            for sp, d in _by_point(df, ["YearMonth", VALUE_COL])
+        ]
+
+        traces = [
+            go.Scattergl(
+                name=sp,
+                legendgroup=sp,
+                showlegend=True,
+                mode="markers",
+                x=d["YearMonth"],
+                # float32 is plenty for display and halves the bulk of the payload
+                y=d[VALUE_COL].astype(np.float32),
+                hovertemplate=f"Sampling Point={sp}<br>Time=%{{x}}<br>Detected Concentration=%{{y}}<extra></extra>",
+                marker=dict(
+                    color=POINT_COLORS[i % len(POINT_COLORS)],
+                    symbol=POINT_SYMBOLS[i % len(POINT_SYMBOLS)],
+                    size=12,
+                ),
+            )
+            for i, (sp, d) in enumerate(series)
+        ]
+
+        fig = go.Figure(traces)
+        fig.update_layout(
             title=f"Concentration of {name}",
+            xaxis_title_text="Time",
+            yaxis_title_text="Detected Concentration",
+            legend=dict(title_text="Sampling Point", tracegroupgap=0),
         )
 
         if pd.notna(ymin) and pd.notna(ymax):
             pad = max(1.0, 0.05 * (ymax - ymin) if ymax > ymin else 1.0)
             fig.update_layout(yaxis_range=[ymin - pad, ymax + pad])
 
-        fig.update_traces(marker=dict(size=12))
         figures.append(fig)
     return figures
 
 
-def build_table_data(point_agg: Dict[str, Dict[str, pd.DataFrame]], mineral: str) -> Dict[str, List[Dict[str, Any]]]:
+def build_table_data(summary: Dict[str, Dict[str, pd.DataFrame]], mineral: str) -> Dict[str, List[Dict[str, Any]]]:
     """
-    Build small tables for display. We format numbers early (reduces JSON size).
+    Build small tables for display from get_top's summary (already sorted by
+    mean). We format numbers early (reduces JSON size).
     """
     out: Dict[str, List[Dict[str, Any]]] = {}
-    for name, df in point_agg[mineral].items():
+    for name, means in summary[mineral].items():
         label = name if "Total" not in name else "Total Detected Concentration"
 
-        tbl = (
-            df[["Sampling Point", "Type", AVG_COL]]
-            .drop_duplicates()
-            .sort_values(by=[AVG_COL], ascending=False)
-            .copy()
-        )
-        tbl[AVG_COL] = tbl[AVG_COL].map(lambda x: f"{x:.2f}")
-        tbl.rename(columns={AVG_COL: "MonthlyMean"}, inplace=True)
-        out[label] = tbl.to_dict("records")
+        tbl = means[["Sampling Point", "Type", AVG_COL]].drop_duplicates()
+        formatted = np.char.mod("%.2f", tbl[AVG_COL].to_numpy(dtype=np.float64))
+        out[label] = tbl.drop(columns=AVG_COL).assign(MonthlyMean=formatted).to_dict("records")
     return out
 
 
 def build_chart_table(initial_table: Dict[str, List[Dict[str, Any]]], initial_dot):
-    table_divs = []
-    dot_graphs = []
-
-    for label, rows in initial_table.items():
-        table_divs.append(
-            html.Div(
-                children=[
-                    html.Div([f"Top {TOP_K} {label}"], style={"margin": 8, "fontSize": 12, "fontWeight": "bold"}),
-                    dash_table.DataTable(
-                        data=rows,
-                        style_cell={
-                            "fontSize": 12,
-                            "textAlign": "left",
-                            "whiteSpace": "normal",
-                            "height": "auto",
-                        },
-                    ),
-                ]
-            )
+    table_divs = [
+        html.Div(
+            children=[
+                html.Div([f"Top {TOP_K} {label}"], style=TABLE_HEADER_STYLE),
+                dash_table.DataTable(data=rows, style_cell=TABLE_CELL_STYLE),
+            ]
         )
-
-    for fig in initial_dot:
-        dot_graphs.append(dcc.Graph(figure=fig, style={"padding": 10, "width": "70%"}))
-
+        for label, rows in initial_table.items()
+    ]
+    dot_graphs = [dcc.Graph(figure=fig, style=GRAPH_STYLE) for fig in initial_dot]
     return table_divs, dot_graphs
 
 
 # =========================
 # Dash app
 # =========================
-app = Dash(title="Mineral Analysis")
+app = Dash(title="Mineral Analysis", compress=True)
 server = app.server
 
-# Load serialized data
-with open(PICKLE_PATH, "rb") as f:
-    raw_base = pickle.load(f)
-
-BASE = get_top(raw_base, TOP_K)
-sanitize_base(BASE)
+# Load serialized data (sanitized + top-k, cached on disk)
+BASE, SUMMARY = load_base(PICKLE_PATH, TOP_PATH, TOP_K)
+VALUE_RANGES = value_ranges(BASE)
 
 minerals = get_minerals(BASE)
 if DEFAULT_MINERAL not in minerals and minerals:
     DEFAULT_MINERAL = minerals[0]
 
+# Precompute every mineral's artifacts once; BASE is static for the life of the process.
+# Stored in callback output order (dot charts, tables, geo figure). Figures are kept as
+# plain dicts (to_plotly_json) so serializing the layout doesn't re-walk go.Figure objects.
+# Nothing mutates these after startup.
+CACHE: Dict[str, Tuple[List[Any], List[Any], Dict[str, Any]]] = {}
+for m in minerals:
+    dot_figs = [fig.to_plotly_json() for fig in build_dot_fig(BASE, m, VALUE_RANGES)]
+    tables, dots = build_chart_table(build_table_data(SUMMARY, m), dot_figs)
+    geo = build_geo_fig(BASE, m, k=TOP_K).to_plotly_json()
+    CACHE[m] = (dots, tables, geo)
+
 # Initial artifacts
-initial_geo = build_geo_fig(BASE, DEFAULT_MINERAL, k=TOP_K)
-initial_dot = build_dot_fig(BASE, DEFAULT_MINERAL)
-initial_table = build_table_data(BASE, DEFAULT_MINERAL)
-table_list, dot_charts = build_chart_table(initial_table, initial_dot)
+dot_charts, table_list, initial_geo = CACHE[DEFAULT_MINERAL]
 
 app.layout = html.Div(
     [
@@ -310,6 +481,8 @@ app.layout = html.Div(
                 ),
                 html.Div(children=dot_charts, id="mineral-dot-chart"),
                 html.Div([dcc.Graph(figure=initial_geo, id="mineral-geoscatter-chart")]),
+                # Every mineral's artifacts, shipped once with the layout for the clientside callback
+                dcc.Store(id="cache-store", data=CACHE),
             ]
         )
     ]
@@ -319,18 +492,23 @@ app.layout = html.Div(
 # =========================
 # Callback
 # =========================
-@callback(
+# Switching minerals is a lookup into cache-store in the browser: no server round trip.
+# The entry is deep-copied because Plotly writes computed state (e.g. autoranges) back
+# into the figure it is given, and the stored copy is reused on the next visit.
+app.clientside_callback(
+    """
+    function (mineral, cache) {
+        return JSON.parse(JSON.stringify(cache[mineral]));
+    }
+    """,
     Output("mineral-dot-chart", "children"),
     Output("mineral-table", "children"),
     Output("mineral-geoscatter-chart", "figure"),
     Input("mineral-dropdown", "value"),
+    State("cache-store", "data"),
+    # The layout already shows DEFAULT_MINERAL
+    prevent_initial_call=True,
 )
-def update_all(chosen_mineral: str) -> Tuple[List[Any], List[Any], Any]:
-    geo_fig = build_geo_fig(BASE, chosen_mineral, k=TOP_K)
-    dot_figs = build_dot_fig(BASE, chosen_mineral)
-    table_data = build_table_data(BASE, chosen_mineral)
-    tables, dots = build_chart_table(table_data, dot_figs)
-    return dots, tables, geo_fig
 
 
 if __name__ == "__main__":
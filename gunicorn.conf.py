@@ -0,0 +1,15 @@
+# Gunicorn settings; picked up automatically when `gunicorn` is run from this directory.
+import gc
+
+wsgi_app = "20DB:server"
+
+# Import the app (pickle load + precomputed figures) once in the master process.
+# Forked workers then share those pages copy-on-write instead of each one
+# unpickling and rebuilding BASE.
+preload_app = True
+
+
+def pre_fork(server, worker):
+    # Move everything loaded so far (BASE, cached figures) to the GC's permanent
+    # generation, so collections in the workers don't touch, and un-share, those pages.
+    gc.freeze()